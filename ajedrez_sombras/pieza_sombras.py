@@ -10,9 +10,153 @@ Cada pieza:
 El Boss es un Rey Caído con el atributo es_boss=True y estadísticas especiales.
 """
 
+import logging
+
 import pygame
 from .constantes import *
 
+log = logging.getLogger(__name__)
+
+# Centro en píxeles de la casilla (0, 0); el resto se obtiene sumando grid * TILE_SIZE
+_PX_ORIG_X = BOARD_OFFSET_X + TILE_SIZE // 2
+_PX_ORIG_Y = BOARD_OFFSET_Y + TILE_SIZE // 2
+
+# Sprites ya compuestos (escalados y con borde), compartidos por todas las piezas
+# del mismo tipo/equipo. Clave: (tipo, team, es_boss)
+_SPRITE_CACHE = {}
+
+# Fuente y letras renderizadas del modo legacy (se crean al primer uso)
+_LEGACY_FONT = None
+_LETRAS_LEGACY = {}
+
+# Fuente de los números de HP sobre la barra (se crea al primer uso)
+_HP_FONT = None
+
+# Textos de HP renderizados (texto, sombra), compartidos entre piezas.
+# Clave: (hp, hp_max). Tamaño acotado con expulsión FIFO.
+_TEXTOS_HP = {}
+_TEXTOS_HP_MAX = 64
+
+
+def _get_legacy_font():
+    """Devuelve la fuente del modo legacy, creándola una sola vez."""
+    global _LEGACY_FONT
+    if _LEGACY_FONT is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        _LEGACY_FONT = pygame.font.SysFont("Arial", 14)
+    return _LEGACY_FONT
+
+
+def _get_hp_font():
+    """Devuelve la fuente de los números de HP, creándola una sola vez."""
+    global _HP_FONT
+    if _HP_FONT is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        _HP_FONT = pygame.font.SysFont("Arial", 8, bold=True)
+    return _HP_FONT
+
+
+def _texto_hp(hp, hp_max):
+    """Devuelve (texto, sombra) renderizados para "hp/hp_max", cacheados por valor."""
+    clave = (hp, hp_max)
+    textos = _TEXTOS_HP.get(clave)
+    if textos is None:
+        if len(_TEXTOS_HP) >= _TEXTOS_HP_MAX:
+            # FIFO: se descarta la entrada más antigua (orden de inserción del dict)
+            del _TEXTOS_HP[next(iter(_TEXTOS_HP))]
+        font = _get_hp_font()
+        texto_hp = f"{hp}/{hp_max}"
+        textos = (font.render(texto_hp, True, WHITE), font.render(texto_hp, True, BLACK))
+        _TEXTOS_HP[clave] = textos
+    return textos
+
+
+def _letra_legacy(letra, team):
+    """Devuelve la superficie con la letra del tipo de pieza, cacheada por (letra, team)."""
+    clave = (letra, team)
+    texto = _LETRAS_LEGACY.get(clave)
+    if texto is None:
+        texto = _get_legacy_font().render(letra, True, WHITE)
+        _LETRAS_LEGACY[clave] = texto
+    return texto
+
+
+# Direcciones como tuplas de módulo: se reutilizan sin crear listas en cada llamada
+_DIRS_ORTOGONALES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DIRS_DIAGONALES = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+_DIRS_TODAS = _DIRS_ORTOGONALES + _DIRS_DIAGONALES
+
+
+def _construir_rayo(x, y, dx, dy):
+    """Casillas del tablero desde (x, y) en dirección (dx, dy), ordenadas por distancia."""
+    rayo = []
+    nx, ny = x + dx, y + dy
+    while 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT:
+        rayo.append((nx, ny))
+        nx, ny = nx + dx, ny + dy
+    return tuple(rayo)
+
+
+# Rayos precalculados por casilla y dirección: _RAYOS[(x, y, dx, dy)] -> ((x1, y1), ...)
+# Solo contienen casillas dentro del tablero, así el recorrido no comprueba bordes.
+_RAYOS = {
+    (x, y, dx, dy): _construir_rayo(x, y, dx, dy)
+    for x in range(GRID_WIDTH)
+    for y in range(GRID_HEIGHT)
+    for dx, dy in _DIRS_TODAS
+}
+
+# Mismos rayos como máscaras de bits (bit = y * GRID_WIDTH + x), para detectar el
+# primer bloqueo con una sola operación contra la ocupación del tablero
+_RAYOS_BB = {
+    clave: sum(1 << (ny * GRID_WIDTH + nx) for nx, ny in rayo)
+    for clave, rayo in _RAYOS.items()
+}
+
+# Saltos del Caballo y pasos del Rey
+_OFFSETS_CABALLO = (
+    (1, 2), (1, -2), (-1, 2), (-1, -2),   # 2 vertical, 1 horizontal
+    (2, 1), (2, -1), (-2, 1), (-2, -1)    # 2 horizontal, 1 vertical
+)
+_OFFSETS_REY = _DIRS_TODAS
+
+
+def _construir_destinos(offsets):
+    """Precalcula, para cada casilla, los destinos de los offsets que caen dentro del tablero."""
+    return {
+        (x, y): tuple(
+            (x + dx, y + dy) for dx, dy in offsets
+            if 0 <= x + dx < GRID_WIDTH and 0 <= y + dy < GRID_HEIGHT
+        )
+        for x in range(GRID_WIDTH)
+        for y in range(GRID_HEIGHT)
+    }
+
+
+# Peón: avance por equipo (-1 jugador hacia arriba, +1 enemigo hacia abajo),
+# fila inicial por equipo y desplazamientos horizontales de captura
+_DIRECCION_PEON = {TEAM_PLAYER: -1, TEAM_ENEMY: 1}
+_FILA_INICIAL_PEON = {TEAM_PLAYER: 6, TEAM_ENEMY: 1}
+_CAPTURAS_PEON_DX = (-1, 1)
+
+# Tablas de destinos por casilla: _DESTINOS_CABALLO[(x, y)] -> ((nx, ny), ...)
+_DESTINOS_CABALLO = _construir_destinos(_OFFSETS_CABALLO)
+_DESTINOS_REY = _construir_destinos(_OFFSETS_REY)
+
+
+def _convertir_para_pantalla(superficie, con_alpha=True):
+    """Convierte una superficie al formato de píxel de la pantalla activa.
+    
+    Con el mismo formato que el destino, SDL usa su ruta rápida de blit en lugar
+    de convertir cada píxel en cada frame. Si todavía no hay pantalla creada,
+    devuelve la superficie sin cambios.
+    """
+    if pygame.display.get_surface() is None:
+        return superficie
+    return superficie.convert_alpha() if con_alpha else superficie.convert()
+
 
 class PiezaSombra(pygame.sprite.Sprite):
     """Pieza base con sistema RPG de salud y daño.
@@ -26,6 +170,21 @@ class PiezaSombra(pygame.sprite.Sprite):
         es_boss (bool): True solo para Rey Caído (enemigo final)
     """
     
+    # Atributos propios en slots: se leen por descriptor de slot. pygame.sprite.Sprite
+    # no declara __slots__, así que cada pieza conserva su __dict__ heredado
+    __slots__ = (
+        "grid_x", "grid_y", "team", "tipo", "es_boss", "gestor_recursos",
+        "_cache_movimientos", "_cache_movimientos_turno",
+        "_cache_destinos", "_cache_destinos_turno",
+        "_cache_torre", "_cache_torre_turno", "_cache_alfil", "_cache_alfil_turno",
+        "_barra_hp_clave", "_barra_hp",
+        "hp_max", "hp", "damage", "nombre", "image", "rect",
+    )
+    
+    # Tipo y estadísticas por defecto de cada subclase (se fijan una vez al definirla)
+    _TIPO = None
+    _STATS = None
+    
     def __init__(self, grid_x, grid_y, team, tipo_key, gestor_recursos=None):
         """
         MEJORA 2: Agregar parámetro gestor_recursos para cargar imágenes reales
@@ -40,8 +199,27 @@ class PiezaSombra(pygame.sprite.Sprite):
         self.es_boss = False  # Atributo por defecto (solo Rey Caído puede ser True)
         self.gestor_recursos = gestor_recursos
         
+        # Movimientos cacheados y turno_id del tablero en que se calcularon
+        self._cache_movimientos = None
+        self._cache_movimientos_turno = -1
+        # Mismos destinos como frozenset (se construye solo si se consulta pertenencia)
+        self._cache_destinos = None
+        self._cache_destinos_turno = -1
+        # Rayos de Torre y Alfil cacheados por separado (la Reina los combina)
+        self._cache_torre = None
+        self._cache_torre_turno = -1
+        self._cache_alfil = None
+        self._cache_alfil_turno = -1
+        # Barra de HP ya compuesta y (hp, hp_max) con que se generó
+        self._barra_hp_clave = None
+        self._barra_hp = None
+        
         # Obtener estadísticas RPG según tipo de pieza
-        stats = STATS.get(tipo_key, STATS["PEON"])
+        # Ruta rápida: el tipo propio de la subclase ya tiene sus stats resueltas
+        if tipo_key == self._TIPO:
+            stats = self._STATS
+        else:
+            stats = STATS.get(tipo_key) or STATS["PEON"]
         self.hp_max = stats["hp"]
         self.hp = self.hp_max
         self.damage = stats["dmg"]
@@ -57,6 +235,13 @@ class PiezaSombra(pygame.sprite.Sprite):
         """Carga la imagen de la pieza desde el gestor de recursos o crea un rectángulo."""
         # MEJORA 4: Si tenemos gestor de recursos, usar imágenes reales
         if self.gestor_recursos:
+            # Reutilizar el sprite si ya se compuso para otra pieza igual
+            clave_cache = (self.tipo, self.team, self.es_boss)
+            sprite = _SPRITE_CACHE.get(clave_cache)
+            if sprite is not None:
+                self.image = sprite
+                return
+            
             # Determinar qué imagen cargar según tipo y equipo
             mapa_imagenes = {
                 "PEON": "PEON",
@@ -92,6 +277,10 @@ class PiezaSombra(pygame.sprite.Sprite):
                 # MEJORA 7: Si es Boss, agregar borde dorado especial
                 if self.es_boss:
                     pygame.draw.rect(self.image, YELLOW, self.image.get_rect(), 3)
+                
+                # Convertir una sola vez al formato de la pantalla para blits rápidos
+                self.image = _convertir_para_pantalla(self.image)
+                _SPRITE_CACHE[clave_cache] = self.image
             else:
                 # Fallback: usar rectángulo de color si no hay imagen
                 self._crear_imagen_legacy()
@@ -110,17 +299,34 @@ class PiezaSombra(pygame.sprite.Sprite):
             self.image.fill(GRAY)    # Gris para neutral (raro)
         
         # Etiqueta de tipo de pieza (primera letra)
-        font = pygame.font.SysFont("Arial", 14)
-        text = font.render(self.tipo[0], True, WHITE)
-        self.image.blit(text, (10, 10))
+        self.image.blit(_letra_legacy(self.tipo[0], self.team), (10, 10))
+        # Superficie opaca: basta con convert() para igualar el formato de la pantalla
+        self.image = _convertir_para_pantalla(self.image, con_alpha=False)
+    
+    @classmethod
+    def dibujar_lote(cls, superficie, piezas):
+        """Dibuja varias piezas con una sola llamada a Surface.fblits.
+        
+        Todas las piezas usan sprite completo y los mismos flags de mezcla, así que
+        fblits evita la validación y el coste de llamada de cada blit individual.
+        Las piezas fuera del área de recorte se descartan antes de llegar a SDL.
+        
+        Args:
+            superficie: Superficie destino (normalmente la pantalla)
+            piezas: Iterable de PiezaSombra a dibujar
+        """
+        area = superficie.get_clip()
+        superficie.fblits([(p.image, p.rect) for p in piezas if area.colliderect(p.rect)])
     
     def actualizar_posicion_pixel(self):
         """Actualiza posición visual basada en posición en grid.
         
         Convierte coordenadas de grid (0-7, 0-7) a píxeles en pantalla.
         """
-        self.rect.centerx = BOARD_OFFSET_X + (self.grid_x * TILE_SIZE) + (TILE_SIZE // 2)
-        self.rect.centery = BOARD_OFFSET_Y + (self.grid_y * TILE_SIZE) + (TILE_SIZE // 2)
+        self.rect.center = (
+            _PX_ORIG_X + self.grid_x * TILE_SIZE,
+            _PX_ORIG_Y + self.grid_y * TILE_SIZE,
+        )
     
     def dibujar_barra_hp(self, superficie):
         """
@@ -128,12 +334,29 @@ class PiezaSombra(pygame.sprite.Sprite):
         - Barra verde/amarilla/roja según HP restante
         - Muestra HP actual/máximo
         - Borde destacado para el Boss
+        
+        La barra se compone una vez por valor de HP (ver _componer_barra_hp);
+        cada frame solo se copia con un blit.
+        """
+        clave = (self.hp, self.hp_max)
+        if self._barra_hp_clave != clave:
+            self._barra_hp = self._componer_barra_hp()
+            self._barra_hp_clave = clave
+        
+        imagen, ox, oy = self._barra_hp
+        # Posición de la barra (encima de la pieza), menos el margen de la superficie
+        superficie.blit(imagen, (self.rect.x + 2 - ox, self.rect.y - 8 - oy))
+    
+    def _componer_barra_hp(self):
+        """
+        Genera la superficie con fondo, relleno, borde y números de la barra de HP.
+        
+        Returns:
+            tuple: (superficie, ox, oy) donde (ox, oy) es la posición de la barra
+                   dentro de la superficie (el borde del Boss y el texto sobresalen)
         """
-        # Calcular posición de la barra (encima de la pieza)
         barra_ancho = TILE_SIZE - 15
         barra_alto = 5
-        barra_x = self.rect.x + 2
-        barra_y = self.rect.y - 8
         
         # Calcular porcentaje de HP
         porcentaje_hp = self.hp / self.hp_max
@@ -147,29 +370,37 @@ class PiezaSombra(pygame.sprite.Sprite):
         else:
             color_hp = RED
         
-        # Dibujar fondo de la barra (negro)
-        pygame.draw.rect(superficie, BLACK, (barra_x, barra_y, barra_ancho, barra_alto))
+        # MEJORA 10: Números de HP (solo si usamos imágenes, más espacio visual)
+        text_surface = shadow_surface = None
+        if self.gestor_recursos:
+            # Texto blanco con sombra negra para legibilidad
+            text_surface, shadow_surface = _texto_hp(self.hp, self.hp_max)
+        
+        # Margen alrededor de la barra: 1px para el borde del Boss y lo que
+        # sobresalga el texto centrado (más 1px de la sombra)
+        ox = oy = 1
+        if text_surface is not None:
+            ox = max(ox, (text_surface.get_width() - barra_ancho) // 2 + 1)
+            oy = max(oy, (text_surface.get_height() - barra_alto) // 2 + 1)
+        imagen = pygame.Surface((barra_ancho + 2 * ox + 1, barra_alto + 2 * oy + 1), pygame.SRCALPHA)
         
-        # Dibujar HP actual
+        # Fondo de la barra (negro) y HP actual
+        pygame.draw.rect(imagen, BLACK, (ox, oy, barra_ancho, barra_alto))
         if ancho_hp > 0:
-            pygame.draw.rect(superficie, color_hp, (barra_x, barra_y, ancho_hp, barra_alto))
+            pygame.draw.rect(imagen, color_hp, (ox, oy, ancho_hp, barra_alto))
         
         # MEJORA 9: Si es Boss, agregar borde dorado a la barra
         if self.es_boss:
-            pygame.draw.rect(superficie, YELLOW, (barra_x - 1, barra_y - 1, barra_ancho + 2, barra_alto + 2), 2)
+            pygame.draw.rect(imagen, YELLOW, (ox - 1, oy - 1, barra_ancho + 2, barra_alto + 2), 2)
         else:
-            pygame.draw.rect(superficie, WHITE, (barra_x, barra_y, barra_ancho, barra_alto), 1)
-        
-        # MEJORA 10: Mostrar números de HP para mayor claridad (opcional pero didáctico)
-        if self.gestor_recursos:  # Solo si usamos imágenes (más espacio visual)
-            font = pygame.font.SysFont("Arial", 8, bold=True)
-            texto_hp = f"{self.hp}/{self.hp_max}"
-            text_surface = font.render(texto_hp, True, WHITE)
-            text_rect = text_surface.get_rect(center=(barra_x + barra_ancho // 2, barra_y + barra_alto // 2))
-            # Sombra para legibilidad
-            shadow_surface = font.render(texto_hp, True, BLACK)
-            superficie.blit(shadow_surface, (text_rect.x + 1, text_rect.y + 1))
-            superficie.blit(text_surface, text_rect)
+            pygame.draw.rect(imagen, WHITE, (ox, oy, barra_ancho, barra_alto), 1)
+        
+        if text_surface is not None:
+            text_rect = text_surface.get_rect(center=(ox + barra_ancho // 2, oy + barra_alto // 2))
+            imagen.blit(shadow_surface, (text_rect.x + 1, text_rect.y + 1))
+            imagen.blit(text_surface, text_rect)
+        
+        return _convertir_para_pantalla(imagen), ox, oy
     
     def recibir_damage(self, cantidad):
         """Reduce HP y retorna True si la pieza muere.
@@ -181,7 +412,9 @@ class PiezaSombra(pygame.sprite.Sprite):
             bool: True si la pieza murió (HP <= 0), False en caso contrario
         """
         self.hp -= cantidad
-        print(f"{self.nombre} ({self.team}) recibió {cantidad} de daño. HP: {self.hp}/{self.hp_max}")
+        # Formato diferido: solo se construye el mensaje si DEBUG está activo
+        log.debug("%s (%s) recibió %d de daño. HP: %d/%d",
+                  self.nombre, self.team, cantidad, self.hp, self.hp_max)
         if self.hp <= 0:
             self.kill()  # Elimina el sprite del juego
             return True  # Murió
@@ -190,7 +423,9 @@ class PiezaSombra(pygame.sprite.Sprite):
     def obtener_movimientos_validos(self, tablero):
         """Obtiene lista de movimientos válidos para esta pieza.
         
-        Override en subclases según tipo de pieza.
+        El resultado se cachea hasta que el tablero cambie (tablero.turno_id),
+        así el resaltado, la validación y la IA no recalculan la misma posición.
+        Las subclases implementan _calcular_movimientos_validos().
         
         Args:
             tablero: Instancia de TableroSombras
@@ -198,47 +433,108 @@ class PiezaSombra(pygame.sprite.Sprite):
         Returns:
             list: Tuplas (x, y) de destinos válidos
         """
+        if self._cache_movimientos_turno != tablero.turno_id:
+            self._cache_movimientos = self._calcular_movimientos_validos(tablero)
+            self._cache_movimientos_turno = tablero.turno_id
+        return self._cache_movimientos
+    
+    def es_movimiento_valido(self, tablero, x, y):
+        """Indica si (x, y) es un destino válido para esta pieza.
+        
+        La lista de obtener_movimientos_validos() se conserva para la IA (que
+        elige al azar); para consultas de pertenencia se usa un frozenset
+        cacheado con el mismo turno_id.
+        """
+        if self._cache_destinos_turno != tablero.turno_id:
+            self._cache_destinos = frozenset(self.obtener_movimientos_validos(tablero))
+            self._cache_destinos_turno = tablero.turno_id
+        return (x, y) in self._cache_destinos
+    
+    def _calcular_movimientos_validos(self, tablero):
+        """Calcula los movimientos válidos sin usar la caché.
+        
+        Override en subclases según tipo de pieza.
+        """
         return []
     
-    def esta_en_tablero(self, x, y):
+    def esta_en_tablero(self, x, y, _W=GRID_WIDTH, _H=GRID_HEIGHT):
         """Verifica si una coordenada está dentro del tablero 8x8.
         
+        Los argumentos con guion bajo enlazan las constantes globales como
+        locales (LOAD_FAST); no se deben pasar al llamar.
+        
         Args:
             x, y (int): Coordenadas a verificar
             
         Returns:
             bool: True si 0 <= x,y < 8
         """
-        return 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT
+        return 0 <= x < _W and 0 <= y < _H
     
-    def obtener_movimientos_direccion(self, tablero, dx, dy, max_pasos=8):
+    def obtener_movimientos_direccion(self, tablero, dx, dy, max_pasos=8,
+                                      _W=GRID_WIDTH, _rayos=_RAYOS, _rayos_bb=_RAYOS_BB):
         """Obtiene movimientos válidos en una dirección.
         
         Usado por Torre, Alfil y Reina para calcular movimientos en línea recta.
-        Se detiene al encontrar otra pieza o borde del tablero.
+        Se detiene al encontrar otra pieza o borde del tablero. Es un generador:
+        quien lo consume arma una sola lista con todas las direcciones.
         
         Args:
             tablero: Instancia de TableroSombras
             dx, dy (int): Dirección (-1, 0, 1) en cada eje
             max_pasos (int): Máximo de casillas a recorrer (Alfil 8, Caballo 2, etc.)
+            _W, _rayos, _rayos_bb: Globales enlazadas como locales; no pasar
             
-        Returns:
-            list: Tuplas (x, y) de movimientos válidos
+        Yields:
+            tuple: (x, y) de cada movimiento válido, del más cercano al más lejano
         """
-        movimientos = []
-        for i in range(1, max_pasos + 1):
-            nx, ny = self.grid_x + (dx * i), self.grid_y + (dy * i)
-            if not self.esta_en_tablero(nx, ny):
-                break  # Fuera del tablero
-            
-            objetivo = tablero.obtener_pieza_en(nx, ny)
-            if objetivo is None:
-                movimientos.append((nx, ny))  # Casilla vacía
-            else:
-                if objetivo.team != self.team:
-                    movimientos.append((nx, ny))  # Captura permitida
-                break  # Pieza bloquea
-        return movimientos
+        x0, y0 = self.grid_x, self.grid_y
+        clave = (x0, y0, dx, dy)
+        # El rayo precalculado ya termina en el borde del tablero
+        rayo = _rayos[clave]
+        bloqueos = _rayos_bb[clave] & tablero.ocupacion
+        if not bloqueos:
+            yield from rayo[:max_pasos]  # Rayo libre hasta el borde
+            return
+        
+        # Primer bloqueo: bit más bajo si el índice crece en esta dirección, más alto si no
+        if dy * _W + dx > 0:
+            casilla = (bloqueos & -bloqueos).bit_length() - 1
+        else:
+            casilla = bloqueos.bit_length() - 1
+        by, bx = divmod(casilla, _W)
+        distancia = max(abs(bx - x0), abs(by - y0))
+        
+        yield from rayo[:min(distancia - 1, max_pasos)]  # Casillas vacías
+        # El bloqueo es captura si no está en la ocupación del propio equipo
+        if distancia <= max_pasos and not tablero.ocupacion_equipo.get(self.team, 0) >> casilla & 1:
+            yield (bx, by)  # Captura permitida
+    
+    def _movimientos_torre(self, tablero):
+        """Movimientos en las 4 direcciones ortogonales, cacheados por turno_id.
+        
+        Compartido por Torre y Reina.
+        """
+        if self._cache_torre_turno != tablero.turno_id:
+            self._cache_torre = [
+                m for dx, dy in _DIRS_ORTOGONALES
+                for m in self.obtener_movimientos_direccion(tablero, dx, dy)
+            ]
+            self._cache_torre_turno = tablero.turno_id
+        return self._cache_torre
+    
+    def _movimientos_alfil(self, tablero):
+        """Movimientos en las 4 diagonales, cacheados por turno_id.
+        
+        Compartido por Alfil y Reina.
+        """
+        if self._cache_alfil_turno != tablero.turno_id:
+            self._cache_alfil = [
+                m for dx, dy in _DIRS_DIAGONALES
+                for m in self.obtener_movimientos_direccion(tablero, dx, dy)
+            ]
+            self._cache_alfil_turno = tablero.turno_id
+        return self._cache_alfil
     
     def post_move(self, x_anterior, y_anterior, tablero):
         """Hook llamado después de mover. Override en subclases.
@@ -255,46 +551,53 @@ class PiezaSombra(pygame.sprite.Sprite):
 class PiezaSombraPeon(PiezaSombra):
     """Peón - Movimiento limitado, capturas diagonales.
     
-    - Avanza 1 casilla (2 en primer movimiento)
+    - Avanza 1 casilla (2 si aún está en su fila inicial)
     - Captura en diagonal hacia adelante
     - No puede retroceder
     """
     
+    __slots__ = ()
+    _TIPO = "PEON"
+    _STATS = STATS["PEON"]
+    
     def __init__(self, x, y, team, gestor_recursos=None):
-        super().__init__(x, y, team, "PEON", gestor_recursos)
-        self.primer_movimiento = True
+        super().__init__(x, y, team, self._TIPO, gestor_recursos)
     
-    def obtener_movimientos_validos(self, tablero):
+    def _calcular_movimientos_validos(self, tablero, _W=GRID_WIDTH, _H=GRID_HEIGHT,
+                                      _dir=_DIRECCION_PEON, _fila=_FILA_INICIAL_PEON,
+                                      _capturas_dx=_CAPTURAS_PEON_DX):
         """Calcula movimientos válidos del peón.
         
-        Dirección: -1 para jugador (arriba), +1 para enemigo (abajo)
+        Dirección: -1 para jugador (arriba), +1 para enemigo (abajo).
+        Los argumentos con guion bajo enlazan tablas globales como locales.
         """
         movimientos = []
+        x, y, team = self.grid_x, self.grid_y, self.team
+        grid = tablero.grid
         # Dirección: -1 para jugador (arriba en pantalla), +1 para enemigo (abajo)
-        direccion = -1 if self.team == TEAM_PLAYER else 1
-        
-        # Movimiento frontal: 1 casilla (o 2 en primer movimiento)
-        nx, ny = self.grid_x, self.grid_y + direccion
-        if self.esta_en_tablero(nx, ny) and tablero.obtener_pieza_en(nx, ny) is None:
-            movimientos.append((nx, ny))
-            # Doble movimiento inicial
-            if self.primer_movimiento:
-                nx2, ny2 = self.grid_x, self.grid_y + (direccion * 2)
-                if self.esta_en_tablero(nx2, ny2) and tablero.obtener_pieza_en(nx2, ny2) is None:
-                    movimientos.append((nx2, ny2))
+        direccion = _dir.get(team, 1)
+        ny = y + direccion
+        if not 0 <= ny < _H:
+            return movimientos  # Peón en la última fila: no puede avanzar ni capturar
+        
+        # Movimiento frontal: 1 casilla (o 2 desde la fila inicial)
+        if grid[ny][x] is None:
+            movimientos.append((x, ny))
+            # Doble movimiento inicial: un peón solo está en su fila inicial si no se movió
+            if y == _fila.get(team, 1):
+                ny2 = ny + direccion
+                if 0 <= ny2 < _H and grid[ny2][x] is None:
+                    movimientos.append((x, ny2))
         
         # Capturas diagonales
-        for dx in [-1, 1]:
-            nx, ny = self.grid_x + dx, self.grid_y + direccion
-            if self.esta_en_tablero(nx, ny):
-                objetivo = tablero.obtener_pieza_en(nx, ny)
-                if objetivo and objetivo.team != self.team:
+        for dx in _capturas_dx:
+            nx = x + dx
+            if 0 <= nx < _W:
+                objetivo = grid[ny][nx]
+                if objetivo and objetivo.team != team:
                     movimientos.append((nx, ny))
         
         return movimientos
-    
-    def post_move(self, x_anterior, y_anterior, tablero):
-        self.primer_movimiento = False
 
 
 class PiezaSombraCaballo(PiezaSombra):
@@ -305,23 +608,22 @@ class PiezaSombraCaballo(PiezaSombra):
     - 8 movimientos posibles desde cualquier posición
     """
     
+    __slots__ = ()
+    _TIPO = "CABALLO"
+    _STATS = STATS["CABALLO"]
+    
     def __init__(self, x, y, team, gestor_recursos=None):
-        super().__init__(x, y, team, "CABALLO", gestor_recursos)
+        super().__init__(x, y, team, self._TIPO, gestor_recursos)
     
-    def obtener_movimientos_validos(self, tablero):
+    def _calcular_movimientos_validos(self, tablero):
         """Calcula 8 posibles movimientos en L."""
-        movimientos = []
-        offsets = [
-            (1, 2), (1, -2), (-1, 2), (-1, -2),   # 2 vertical, 1 horizontal
-            (2, 1), (2, -1), (-2, 1), (-2, -1)    # 2 horizontal, 1 vertical
+        team = self.team
+        grid = tablero.grid
+        # La tabla ya excluye los saltos que salen del tablero
+        return [
+            (nx, ny) for nx, ny in _DESTINOS_CABALLO[(self.grid_x, self.grid_y)]
+            if grid[ny][nx] is None or grid[ny][nx].team != team
         ]
-        for dx, dy in offsets:
-            nx, ny = self.grid_x + dx, self.grid_y + dy
-            if self.esta_en_tablero(nx, ny):
-                objetivo = tablero.obtener_pieza_en(nx, ny)
-                if objetivo is None or objetivo.team != self.team:
-                    movimientos.append((nx, ny))
-        return movimientos
 
 
 class PiezaSombraAlpil(PiezaSombra):
@@ -332,15 +634,16 @@ class PiezaSombraAlpil(PiezaSombra):
     - Puede capturar piezas enemigas
     """
     
+    __slots__ = ()
+    _TIPO = "ALFIL"
+    _STATS = STATS["ALFIL"]
+    
     def __init__(self, x, y, team, gestor_recursos=None):
-        super().__init__(x, y, team, "ALFIL", gestor_recursos)
+        super().__init__(x, y, team, self._TIPO, gestor_recursos)
     
-    def obtener_movimientos_validos(self, tablero):
+    def _calcular_movimientos_validos(self, tablero):
         """Calcula movimientos en las 4 diagonales."""
-        movimientos = []
-        for dx, dy in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
-            movimientos.extend(self.obtener_movimientos_direccion(tablero, dx, dy))
-        return movimientos
+        return self._movimientos_alfil(tablero)
 
 
 class PiezaSombraTorre(PiezaSombra):
@@ -351,15 +654,16 @@ class PiezaSombraTorre(PiezaSombra):
     - Una de las piezas más poderosas en el tablero
     """
     
+    __slots__ = ()
+    _TIPO = "TORRE"
+    _STATS = STATS["TORRE"]
+    
     def __init__(self, x, y, team, gestor_recursos=None):
-        super().__init__(x, y, team, "TORRE", gestor_recursos)
+        super().__init__(x, y, team, self._TIPO, gestor_recursos)
     
-    def obtener_movimientos_validos(self, tablero):
+    def _calcular_movimientos_validos(self, tablero):
         """Calcula movimientos en las 4 direcciones cardinales."""
-        movimientos = []
-        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-            movimientos.extend(self.obtener_movimientos_direccion(tablero, dx, dy))
-        return movimientos
+        return self._movimientos_torre(tablero)
 
 
 class PiezaSombraReina(PiezaSombra):
@@ -370,15 +674,16 @@ class PiezaSombraReina(PiezaSombra):
     - La pieza más poderosa junto al Rey (excluyendo Boss)
     """
     
+    __slots__ = ()
+    _TIPO = "REINA"
+    _STATS = STATS["REINA"]
+    
     def __init__(self, x, y, team, gestor_recursos=None):
-        super().__init__(x, y, team, "REINA", gestor_recursos)
+        super().__init__(x, y, team, self._TIPO, gestor_recursos)
     
-    def obtener_movimientos_validos(self, tablero):
-        """Calcula movimientos en todas las 8 direcciones."""
-        movimientos = []
-        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]:
-            movimientos.extend(self.obtener_movimientos_direccion(tablero, dx, dy))
-        return movimientos
+    def _calcular_movimientos_validos(self, tablero):
+        """Calcula movimientos en todas las 8 direcciones (Torre + Alfil)."""
+        return self._movimientos_torre(tablero) + self._movimientos_alfil(tablero)
 
 
 class PiezaSombraRey(PiezaSombra):
@@ -392,19 +697,21 @@ class PiezaSombraRey(PiezaSombra):
         es_boss (bool): True solo para el Rey Caído enemigo (líder de la IA)
     """
     
+    __slots__ = ()
+    _TIPO = "REY"
+    _STATS = STATS["REY"]
+    
     def __init__(self, x, y, team, es_boss=False, gestor_recursos=None):
         # Si es Boss, usa estadísticas especiales ("BOSS" en STATS)
-        tipo_key = "BOSS" if es_boss else "REY"
+        tipo_key = "BOSS" if es_boss else self._TIPO
         super().__init__(x, y, team, tipo_key, gestor_recursos)
         self.es_boss = es_boss  # Marca el Rey Caído
     
-    def obtener_movimientos_validos(self, tablero):
+    def _calcular_movimientos_validos(self, tablero):
         """Calcula movimiento limitado a 1 casilla en cualquier dirección."""
-        movimientos = []
-        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]:
-            nx, ny = self.grid_x + dx, self.grid_y + dy
-            if self.esta_en_tablero(nx, ny):
-                objetivo = tablero.obtener_pieza_en(nx, ny)
-                if objetivo is None or objetivo.team != self.team:
-                    movimientos.append((nx, ny))
-        return movimientos
+        team = self.team
+        grid = tablero.grid
+        return [
+            (nx, ny) for nx, ny in _DESTINOS_REY[(self.grid_x, self.grid_y)]
+            if grid[ny][nx] is None or grid[ny][nx].team != team
+        ]
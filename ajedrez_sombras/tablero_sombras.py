@@ -3,7 +3,7 @@
 import pygame
 from .constantes import *
 from .pieza_sombras import (
-    PiezaSombraPeon, PiezaSombraCaballo, PiezaSombraAlpil,
+    PiezaSombra, PiezaSombraPeon, PiezaSombraCaballo, PiezaSombraAlpil,
     PiezaSombraTorre, PiezaSombraReina, PiezaSombraRey
 )
 
@@ -21,6 +21,11 @@ class TableroSombras:
         self.piezas = pygame.sprite.Group()
         self.niebla = [[True for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
         self.gestor_recursos = gestor_recursos  # Guardar referencia al gestor
+        # Contador de cambios del tablero; invalida los movimientos cacheados en las piezas
+        self.turno_id = 0
+        # Bitboards de ocupación (bit = y * GRID_WIDTH + x): total y por equipo
+        self.ocupacion = 0
+        self.ocupacion_equipo = {TEAM_PLAYER: 0, TEAM_ENEMY: 0}
         self.configurar_tablero()
         self.actualizar_niebla(TEAM_PLAYER)
     
@@ -52,11 +57,19 @@ class TableroSombras:
         for x in range(8):
             self.agregar_pieza(PiezaSombraPeon(x, 1, TEAM_ENEMY, self.gestor_recursos))
     
+    def _alternar_ocupacion(self, pieza, x, y):
+        """Marca o desmarca (x, y) en los bitboards de ocupación para la pieza."""
+        bit = 1 << (y * GRID_WIDTH + x)
+        self.ocupacion ^= bit
+        self.ocupacion_equipo[pieza.team] = self.ocupacion_equipo.get(pieza.team, 0) ^ bit
+    
     def agregar_pieza(self, pieza):
         """Agrega una pieza al tablero."""
         if self.grid[pieza.grid_y][pieza.grid_x] is None:
             self.grid[pieza.grid_y][pieza.grid_x] = pieza
             self.piezas.add(pieza)
+            self._alternar_ocupacion(pieza, pieza.grid_x, pieza.grid_y)
+            self.turno_id += 1
         else:
             print(f"No se puede añadir pieza en ({pieza.grid_x},{pieza.grid_y}), casilla ocupada.")
     
@@ -79,11 +92,15 @@ class TableroSombras:
                 if murio:
                     self.piezas.remove(objetivo)
                     self.grid[y][x] = None
+                    self._alternar_ocupacion(objetivo, x, y)
                     # Si muere, el atacante ocupa la casilla
                     self.grid[y_anterior][x_anterior] = None
+                    self._alternar_ocupacion(pieza, x_anterior, y_anterior)
                     pieza.grid_x = x
                     pieza.grid_y = y
                     self.grid[y][x] = pieza
+                    self._alternar_ocupacion(pieza, x, y)
+                    self.turno_id += 1
                     pieza.actualizar_posicion_pixel()
                     pieza.post_move(x_anterior, y_anterior, self)
                     return True
@@ -94,9 +111,12 @@ class TableroSombras:
         # Movimiento normal (casilla vacía)
         if self.obtener_pieza_en(x, y) is None:
             self.grid[y_anterior][x_anterior] = None
+            self._alternar_ocupacion(pieza, x_anterior, y_anterior)
             pieza.grid_x = x
             pieza.grid_y = y
             self.grid[y][x] = pieza
+            self._alternar_ocupacion(pieza, x, y)
+            self.turno_id += 1
             pieza.actualizar_posicion_pixel()
             pieza.post_move(x_anterior, y_anterior, self)
             return True
@@ -135,16 +155,14 @@ class TableroSombras:
                 color = LIGHT_BOARD if (x + y) % 2 == 0 else DARK_BOARD
                 pygame.draw.rect(pantalla, color, rect)
         
-        # Dibujar piezas
-        for pieza in self.piezas:
-            # Las piezas aliadas siempre son visibles
-            # Las piezas enemigas solo si no hay niebla
-            visible = True
-            if pieza.team != TEAM_PLAYER and self.niebla[pieza.grid_y][pieza.grid_x]:
-                visible = False
-            
-            if visible:
-                pantalla.blit(pieza.image, pieza.rect)
+        # Dibujar piezas en un solo lote
+        # Las piezas aliadas siempre son visibles
+        # Las piezas enemigas solo si no hay niebla
+        visibles = [
+            pieza for pieza in self.piezas
+            if pieza.team == TEAM_PLAYER or not self.niebla[pieza.grid_y][pieza.grid_x]
+        ]
+        PiezaSombra.dibujar_lote(pantalla, visibles)
         
         # Dibujar niebla de guerra
         for y in range(GRID_HEIGHT):
@@ -85,16 +85,8 @@ class ServidorAjedrez:
             else:
                 self.socket_servidor.settimeout(None)
                 
-            self.socket_cliente, self.direccion_cliente = self.socket_servidor.accept()
-            self.socket_cliente.settimeout(0.1)  # Non-blocking para recibir
-            self.conectado = True
-            print(f"Cliente conectado desde {self.direccion_cliente}")
-            
-            # Iniciar hilo de escucha de movimientos
-            self._ejecutando = True
-            self.hilo_escucha = threading.Thread(target=self._escuchar_movimientos, daemon=True)
-            self.hilo_escucha.start()
-            
+            socket_cliente, direccion_cliente = self.socket_servidor.accept()
+            self._registrar_cliente(socket_cliente, direccion_cliente)
             return True
         except socket.timeout:
             return False
@@ -102,6 +94,59 @@ class ServidorAjedrez:
             print(f"Error al esperar conexión: {e}")
             return False
     
+    def escucha_no_bloqueante(self) -> Optional[socket.socket]:
+        """Pone el socket de escucha en modo no bloqueante y lo devuelve.
+        
+        El socket devuelto sirve para vigilarlo con select(); cuando esté listo
+        para lectura, aceptar el cliente con aceptar_conexion_pendiente().
+        
+        Returns:
+            El socket de escucha, o None si el servidor no está iniciado
+        """
+        if not self.socket_servidor:
+            return None
+        self.socket_servidor.setblocking(False)
+        return self.socket_servidor
+    
+    def aceptar_conexion_pendiente(self) -> bool:
+        """Acepta un cliente sin bloquear, si hay una conexión pendiente.
+        
+        Pensado para un socket de escucha no bloqueante vigilado con select():
+        no modifica el timeout del socket en cada intento.
+        
+        Returns:
+            True si hay un cliente conectado, False si no había conexión pendiente o hubo error
+        """
+        if self.conectado:
+            return True
+        if not self.socket_servidor:
+            return False
+        
+        try:
+            socket_cliente, direccion_cliente = self.socket_servidor.accept()
+        except (BlockingIOError, socket.timeout):
+            return False
+        except Exception as e:
+            print(f"Error al aceptar conexión: {e}")
+            return False
+        
+        self._registrar_cliente(socket_cliente, direccion_cliente)
+        return True
+    
+    def _registrar_cliente(self, socket_cliente: socket.socket, direccion_cliente: Tuple[str, int]):
+        """Guarda el cliente aceptado e inicia el hilo de escucha (una sola vez)."""
+        self.socket_cliente = socket_cliente
+        self.direccion_cliente = direccion_cliente
+        self.socket_cliente.settimeout(0.1)  # Non-blocking para recibir
+        self.conectado = True
+        print(f"Cliente conectado desde {self.direccion_cliente}")
+        
+        # Iniciar hilo de escucha de movimientos si no hay uno activo
+        self._ejecutando = True
+        if self.hilo_escucha is None or not self.hilo_escucha.is_alive():
+            self.hilo_escucha = threading.Thread(target=self._escuchar_movimientos, daemon=True)
+            self.hilo_escucha.start()
+    
     def _escuchar_movimientos(self):
         """Hilo que escucha continuamente movimientos del cliente."""
         buffer = ""
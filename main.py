@@ -7,17 +7,43 @@ Orquesta el flujo inicial:
 - Controla el bucle principal de juego
 - Integración con Stockfish mediante motor_ajedrez.py
 """
+import logging
 import pygame
-import socket
+import queue
+import selectors
 import threading
-from ui import Menu, InterfazUsuario
+from functools import lru_cache
+from ui import Menu, InterfazUsuario, EntradaTexto, EVENTOS_JUEGO
 from lan import ServidorAjedrez, ClienteAjedrez, DescubridorServidores, PUERTO_JUEGO
 from modelos import Color
 from reglas import sugerir_movimiento
 from motor_ajedrez import MotorAjedrez, NivelDificultad, EstadoMotor
 from ajedrez_sombras import TableroSombras, IASombras
 
+log = logging.getLogger(__name__)
+
+# Tipos de evento y funciones de pygame ligados al módulo (evita buscar el atributo en cada frame)
+QUIT = pygame.QUIT
+MOUSEBUTTONDOWN = pygame.MOUSEBUTTONDOWN
+_flip = pygame.display.flip
+_get_ticks = pygame.time.get_ticks
+
+# Fuente del modo Sombras, compartida entre partidas (se crea al primer uso)
+_FUENTE = None
+
+
+def _obtener_fuente():
+    """Devuelve la fuente Arial 16 del modo Sombras, creándola una sola vez."""
+    global _FUENTE
+    if _FUENTE is None:
+        _FUENTE = pygame.font.SysFont("Arial", 16)
+    return _FUENTE
+
 def main():
+    pygame.init()
+    # Eventos que ningún bucle usa: bloquearlos evita que lleguen a la cola
+    pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.ACTIVEEVENT, pygame.VIDEOEXPOSE])
+    
     try:
         # Bucle principal para volver al menú después de cada partida
         while True:
@@ -91,59 +117,84 @@ def main():
         pygame.quit()
 
 
+def _procesar_click(tablero, seleccionado, click, color):
+    """Aplica un click a la selección/movimiento de piezas del jugador.
+    
+    Máquina de estados común a todos los modos clásicos: el primer click
+    selecciona una pieza propia; el segundo intenta moverla y, si el movimiento
+    no es válido, selecciona otra pieza propia o cancela la selección.
+    
+    Args:
+        tablero: El tablero de juego
+        seleccionado: Casilla seleccionada actualmente, o None
+        click: Casilla clicada
+        color: Color cuyas piezas puede seleccionar el jugador
+    
+    Returns:
+        Tupla (nuevo_seleccionado, movido)
+    """
+    # Con una pieza ya seleccionada, el click es un intento de movimiento
+    if seleccionado is not None and tablero.realizar_movimiento(seleccionado, click):
+        return None, True
+    
+    # Sin movimiento: seleccionar la pieza clicada si es propia, o cancelar
+    pieza_click = tablero.casillas.get(click)
+    if pieza_click is not None and pieza_click.color == color:
+        return click, False
+    return None, False
+
+
 def juego_local():
     """Ejecuta una partida local (Jugador vs Jugador)."""
     # Crear la interfaz de usuario y preparar estado de selección
     interfaz = InterfazUsuario()
+    tablero = interfaz.tablero  # No cambia durante la partida
     seleccionado = None
     clock = pygame.time.Clock()
+    # Solo se redibuja cuando algo visible cambió (click, movimiento, reloj)
+    dirty = True
     
     while True:
         # Delta time para temporizadores de UI
         dt = clock.tick(60) / 1000.0
-        interfaz.actualizar_tiempos(dt)
+        if interfaz.actualizar_tiempos(dt):
+            dirty = True
         
         # Manejo de eventos: clics y cierre de ventana
-        continuar, click = interfaz.manejar_eventos()
+        continuar, click, expuesta = interfaz.manejar_eventos()
         if not continuar:
             break
+        if expuesta:
+            dirty = True  # La ventana volvió a verse: repintar aunque no haya cambios
         
         if click:
-            if seleccionado is None:
-                if (click in interfaz.tablero.casillas and 
-                    interfaz.tablero.casillas[click] and 
-                    interfaz.tablero.casillas[click].color == interfaz.tablero.turno):
-                    seleccionado = click
-            else:
-                if interfaz.tablero.realizar_movimiento(seleccionado, click):
-                    # Reproducir sonido al mover la ficha (si está disponible)
-                    interfaz.reproducir_sonido_movimiento()
-                    seleccionado = None
-                else:
-                    if (click in interfaz.tablero.casillas and 
-                        interfaz.tablero.casillas[click] and 
-                        interfaz.tablero.casillas[click].color == interfaz.tablero.turno):
-                        seleccionado = click
-                    else:
-                        seleccionado = None
+            seleccionado, movido = _procesar_click(
+                tablero, seleccionado, click, tablero.turno
+            )
+            if movido:
+                # Reproducir sonido al mover la ficha (si está disponible)
+                interfaz.reproducir_sonido_movimiento()
+            dirty = True
         
         # Redibujar tablero y actualizar pantalla
-        interfaz.dibujar_tablero(seleccionado)
-        pygame.display.flip()
+        if dirty:
+            interfaz.dibujar_tablero(seleccionado)
+            _flip()
+            dirty = False
 
 
+@lru_cache(maxsize=4096)
 def _lan_a_coords(lan: str):
-    """Convierte un movimiento LAN (e2e4) a coordenadas (x, y)."""
+    """Convierte un movimiento LAN (e2e4) a coordenadas (x, y).
+    
+    El tablero interno usa y=0 arriba; rank 1 corresponde a y=0. Los caracteres
+    a partir del quinto (promoción, p. ej. "e7e8q") se ignoran.
+    """
     if not lan or len(lan) < 4:
         return None
-    a, r1, b, r2 = lan[0], lan[1], lan[2], lan[3]
-    def sq_to_xy(file_char: str, rank_char: str):
-        x = ord(file_char) - ord('a')
-        r = int(rank_char)
-        # El tablero interno usa y=0 arriba; rank 1 corresponde a y=0.
-        y = r - 1
-        return (x, y)
-    return (sq_to_xy(a, r1), sq_to_xy(b, r2))
+    # Indexar bytes devuelve enteros directamente: 'a' = 97, '1' = 49
+    b = lan.encode('ascii')
+    return ((b[0] - 97, b[1] - 49), (b[2] - 97, b[3] - 49))
 
 
 def _obtener_movimiento_aleatorio(tablero):
@@ -188,6 +239,7 @@ def juego_vs_maquina(motor_type: str = "stockfish"):
     Usa threading no-bloqueante para evitar congelamiento de la interfaz.
     """
     interfaz = InterfazUsuario()
+    tablero = interfaz.tablero  # No cambia durante la partida
     seleccionado = None
     clock = pygame.time.Clock()
     
@@ -216,6 +268,8 @@ def juego_vs_maquina(motor_type: str = "stockfish"):
     # Variables para manejo de búsqueda asincrónica
     movimiento_ia_listo = False
     resultado_ia = None
+    # Instante (ms) en que la IA aleatoria hará su movimiento, o None si no está pensando
+    limite_ia_ms = None
     
     def callback_movimiento_ia(resultado):
         """Callback cuando el motor termina la búsqueda."""
@@ -223,22 +277,27 @@ def juego_vs_maquina(motor_type: str = "stockfish"):
         resultado_ia = resultado
         movimiento_ia_listo = True
     
+    # Solo se redibuja cuando algo visible cambió (click, movimiento, mensaje, reloj)
+    dirty = True
+    
     try:
         while True:
             dt = clock.tick(60) / 1000.0
-            interfaz.actualizar_tiempos(dt)
+            if interfaz.actualizar_tiempos(dt):
+                dirty = True
             
             # Si es turno de la IA (negras)
-            if interfaz.tablero.turno == Color.NEGRO:
+            if tablero.turno == Color.NEGRO:
                 if motor_type == "stockfish" and motor_disponible:
                     # Usar Stockfish (asincrónico)
                     if not motor.esta_calculando() and not movimiento_ia_listo:
                         motor.buscar_movimiento_async(
-                            interfaz.tablero.casillas,
-                            interfaz.tablero.turno,
+                            tablero.casillas,
+                            tablero.turno,
                             callback_movimiento_ia
                         )
                         interfaz.mensaje_estado = "🤖 Stockfish pensando..."
+                        dirty = True
                     
                     # Si el movimiento está listo, ejecutarlo
                     if movimiento_ia_listo and resultado_ia and resultado_ia.exitoso:
@@ -246,11 +305,12 @@ def juego_vs_maquina(motor_type: str = "stockfish"):
                         coords = _lan_a_coords(lan)
                         if coords:
                             origen, destino = coords
-                            if interfaz.tablero.realizar_movimiento(origen, destino):
+                            if tablero.realizar_movimiento(origen, destino):
                                 interfaz.reproducir_sonido_movimiento()
                                 movimiento_ia_listo = False
                                 resultado_ia = None
                                 interfaz.mensaje_estado = None
+                                dirty = True
                             else:
                                 print(f"❌ Movimiento de Stockfish inválido: {lan}")
                                 break
@@ -262,55 +322,51 @@ def juego_vs_maquina(motor_type: str = "stockfish"):
                         break
                 
                 elif motor_type == "random":
-                    # Usar IA aleatoria (bloqueante pero rápido)
-                    interfaz.mensaje_estado = "🎲 IA Aleatoria pensando..."
-                    interfaz.dibujar_tablero(seleccionado)
-                    pygame.display.flip()
-                    
-                    # Pequeño delay para que se vea el mensaje
-                    pygame.time.wait(200)
-                    
-                    # Obtener movimiento aleatorio
-                    movimiento_aleatorio = _obtener_movimiento_aleatorio(interfaz.tablero)
-                    if movimiento_aleatorio:
-                        origen, destino = movimiento_aleatorio
-                        if interfaz.tablero.realizar_movimiento(origen, destino):
-                            interfaz.reproducir_sonido_movimiento()
-                            interfaz.mensaje_estado = None
+                    # Usar IA aleatoria: mostrar el mensaje y mover pasados 200 ms,
+                    # sin bloquear el bucle (la ventana sigue atendiendo eventos)
+                    if limite_ia_ms is None:
+                        interfaz.mensaje_estado = "🎲 IA Aleatoria pensando..."
+                        limite_ia_ms = _get_ticks() + 200
+                        dirty = True
+                    elif _get_ticks() >= limite_ia_ms:
+                        limite_ia_ms = None
+                        
+                        # Obtener movimiento aleatorio
+                        movimiento_aleatorio = _obtener_movimiento_aleatorio(tablero)
+                        if movimiento_aleatorio:
+                            origen, destino = movimiento_aleatorio
+                            if tablero.realizar_movimiento(origen, destino):
+                                interfaz.reproducir_sonido_movimiento()
+                                interfaz.mensaje_estado = None
+                                dirty = True
+                            else:
+                                print("❌ Movimiento aleatorio inválido")
+                                break
                         else:
-                            print("❌ Movimiento aleatorio inválido")
+                            print("❌ No hay movimientos disponibles")
                             break
-                    else:
-                        print("❌ No hay movimientos disponibles")
-                        break
             
             # Manejo de eventos: clics y cierre de ventana
-            continuar, click = interfaz.manejar_eventos()
+            continuar, click, expuesta = interfaz.manejar_eventos()
             if not continuar:
                 break
+            if expuesta:
+                dirty = True  # La ventana volvió a verse: repintar aunque no haya cambios
             
             # Turno del jugador (blancas)
-            if click and interfaz.tablero.turno == Color.BLANCO:
-                if seleccionado is None:
-                    if (click in interfaz.tablero.casillas and 
-                        interfaz.tablero.casillas[click] and 
-                        interfaz.tablero.casillas[click].color == interfaz.tablero.turno):
-                        seleccionado = click
-                else:
-                    if interfaz.tablero.realizar_movimiento(seleccionado, click):
-                        interfaz.reproducir_sonido_movimiento()
-                        seleccionado = None
-                    else:
-                        if (click in interfaz.tablero.casillas and 
-                            interfaz.tablero.casillas[click] and 
-                            interfaz.tablero.casillas[click].color == interfaz.tablero.turno):
-                            seleccionado = click
-                        else:
-                            seleccionado = None
+            if click and tablero.turno == Color.BLANCO:
+                seleccionado, movido = _procesar_click(
+                    tablero, seleccionado, click, Color.BLANCO
+                )
+                if movido:
+                    interfaz.reproducir_sonido_movimiento()
+                dirty = True
             
             # Redibujar tablero y actualizar pantalla
-            interfaz.dibujar_tablero(seleccionado)
-            pygame.display.flip()
+            if dirty:
+                interfaz.dibujar_tablero(seleccionado)
+                _flip()
+                dirty = False
     
     finally:
         if motor and motor_disponible:
@@ -328,72 +384,63 @@ def juego_lan_servidor():
     
     # Crear interfaz mostrando que esperamos conexión
     interfaz = InterfazUsuario()
-    clock = pygame.time.Clock()
+    tablero = interfaz.tablero  # No cambia durante la partida
     
     # Esperar conexión con bucle que actualiza pantalla
     print("Esperando cliente (60 segundos)...")
-    tiempo_inicio = pygame.time.get_ticks() / 1000.0
-    timeout_conexion = 60.0
+    # Tiempos en milisegundos enteros, como los entrega SDL
+    tiempo_inicio_ms = _get_ticks()
+    timeout_conexion_ms = 60_000
     
-    while not servidor.conectado:
-        dt = clock.tick(60) / 1000.0
-        tiempo_elapsed = (pygame.time.get_ticks() / 1000.0) - tiempo_inicio
-        
-        # Verificar timeout
-        if tiempo_elapsed > timeout_conexion:
-            print("No se conectó ningún cliente")
-            servidor.cerrar()
-            return
-        
-        # Manejar eventos de Pygame (permitir cerrar ventana)
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
+    # Socket de escucha no bloqueante vigilado con un selector: el bucle duerme
+    # en select() hasta que llega un cliente o pasan 0.25s, en lugar de girar a 60 FPS
+    sel = selectors.DefaultSelector()
+    sel.register(servidor.escucha_no_bloqueante(), selectors.EVENT_READ)
+    ultimo_restante = None
+    
+    try:
+        while not servidor.conectado:
+            listo = sel.select(timeout=0.25)
+            elapsed_ms = _get_ticks() - tiempo_inicio_ms
+            
+            # Verificar timeout
+            if elapsed_ms > timeout_conexion_ms:
+                print("No se conectó ningún cliente")
                 servidor.cerrar()
                 return
-        
-        # Intentar aceptar conexión (no bloqueante)
-        if servidor.socket_servidor:
-            try:
-                servidor.socket_servidor.settimeout(0.1)
-                cliente_socket, cliente_addr = servidor.socket_servidor.accept()
-                servidor.socket_cliente = cliente_socket
-                servidor.direccion_cliente = cliente_addr
-                servidor.socket_cliente.settimeout(0.1)
-                servidor.conectado = True
-                servidor._ejecutando = True
-                
-                # Iniciar hilo de escucha
-                servidor.hilo_escucha = threading.Thread(
-                    target=servidor._escuchar_movimientos, 
-                    daemon=True
-                )
-                servidor.hilo_escucha.start()
-                
-                print(f"Cliente conectado desde {cliente_addr}")
+            
+            # Manejar eventos de Pygame (permitir cerrar ventana); solo se extraen los QUIT
+            if pygame.event.get(eventtype=QUIT, pump=True):
+                servidor.cerrar()
+                return
+            
+            # Aceptar conexión solo cuando el selector indica que hay un cliente
+            if listo and servidor.aceptar_conexion_pendiente():
                 break
-            except socket.timeout:
-                pass
-            except Exception:
-                pass
-        
-        # Actualizar mensaje con tiempo restante
-        tiempo_restante = int(timeout_conexion - tiempo_elapsed)
-        interfaz.mensaje_estado = f"Esperando cliente... ({tiempo_restante}s)"
-        
-        # Redibujar
-        interfaz.dibujar_tablero()
-        pygame.display.flip()
+            
+            # Redibujar solo cuando cambia el segundo mostrado
+            tiempo_restante = (timeout_conexion_ms - elapsed_ms) // 1000
+            if tiempo_restante != ultimo_restante:
+                ultimo_restante = tiempo_restante
+                interfaz.mensaje_estado = f"Esperando cliente... ({tiempo_restante}s)"
+                interfaz.dibujar_tablero()
+                _flip()
+    finally:
+        sel.close()
+    
+    # Descartar los eventos acumulados mientras solo se leían los QUIT
+    pygame.event.clear()
     
     if not servidor.conectado:
         return
     
-    # Variable para almacenar movimientos del oponente
-    movimiento_pendiente = {'origen': None, 'destino': None}
+    # Cola de movimientos del oponente: el hilo de red escribe y el bucle de juego lee
+    # Sin límite: llega un movimiento por turno y no debe perderse ninguno
+    cola_movimientos = queue.Queue()
     
     def recibir_movimiento_oponente(origen, destino):
         """Callback cuando se recibe un movimiento del cliente."""
-        movimiento_pendiente['origen'] = origen
-        movimiento_pendiente['destino'] = destino
+        cola_movimientos.put_nowait((origen, destino))
     
     servidor.establecer_callback_movimiento(recibir_movimiento_oponente)
     
@@ -401,95 +448,150 @@ def juego_lan_servidor():
     seleccionado = None
     clock = pygame.time.Clock()
     
+    interfaz.mensaje_estado = None  # Limpiar mensaje de espera
+    # Solo se redibuja cuando algo visible cambió (click, movimiento, reloj)
+    dirty = True
+    
     while True:
         dt = clock.tick(60) / 1000.0
-        interfaz.actualizar_tiempos(dt)
-        interfaz.mensaje_estado = None  # Limpiar mensaje de espera
+        if interfaz.actualizar_tiempos(dt):
+            dirty = True
         
-        # Verificar si hay movimiento del oponente
-        if movimiento_pendiente['origen'] is not None:
-            origen = movimiento_pendiente['origen']
-            destino = movimiento_pendiente['destino']
-            movimiento_pendiente['origen'] = None
-            movimiento_pendiente['destino'] = None
-            
-            # Aplicar movimiento del oponente (negras)
-            if interfaz.tablero.realizar_movimiento(origen, destino):
-                interfaz.reproducir_sonido_movimiento()
+        # Aplicar los movimientos del oponente (negras) recibidos desde el último frame
+        if _aplicar_movimientos_oponente(cola_movimientos, tablero, interfaz):
+            dirty = True
         
         # Manejo de eventos locales
-        continuar, click = interfaz.manejar_eventos()
+        continuar, click, expuesta = interfaz.manejar_eventos()
         if not continuar or not servidor.conectado:
             break
+        if expuesta:
+            dirty = True  # La ventana volvió a verse: repintar aunque no haya cambios
         
         # Solo permitir clicks si es el turno de blancas (servidor)
-        if click and interfaz.tablero.turno == Color.BLANCO:
-            if seleccionado is None:
-                if (click in interfaz.tablero.casillas and 
-                    interfaz.tablero.casillas[click] and 
-                    interfaz.tablero.casillas[click].color == Color.BLANCO):
-                    seleccionado = click
-            else:
-                if interfaz.tablero.realizar_movimiento(seleccionado, click):
-                    # Enviar el movimiento al cliente
-                    servidor.enviar_movimiento(seleccionado, click)
-                    interfaz.reproducir_sonido_movimiento()
-                    seleccionado = None
-                else:
-                    if (click in interfaz.tablero.casillas and 
-                        interfaz.tablero.casillas[click] and 
-                        interfaz.tablero.casillas[click].color == Color.BLANCO):
-                        seleccionado = click
-                    else:
-                        seleccionado = None
+        if click and tablero.turno == Color.BLANCO:
+            origen = seleccionado
+            seleccionado, movido = _procesar_click(
+                tablero, seleccionado, click, Color.BLANCO
+            )
+            if movido:
+                # Enviar el movimiento al cliente
+                servidor.enviar_movimiento(origen, click)
+                interfaz.reproducir_sonido_movimiento()
+            dirty = True
         
         # Redibujar
-        interfaz.dibujar_tablero(seleccionado)
-        pygame.display.flip()
+        if dirty:
+            interfaz.dibujar_tablero(seleccionado)
+            _flip()
+            dirty = False
     
     servidor.cerrar()
 
 
+def _aplicar_movimientos_oponente(cola, tablero, interfaz) -> bool:
+    """Aplica todos los movimientos del oponente pendientes en la cola.
+    
+    Común a servidor y cliente LAN: el sonido suena una sola vez aunque
+    lleguen varios movimientos en el mismo frame.
+    
+    Args:
+        cola: Cola que llena el hilo de red con tuplas (origen, destino)
+        tablero: El tablero de juego
+        interfaz: Interfaz que reproduce el sonido de movimiento
+    
+    Returns:
+        True si se aplicó algún movimiento (hay que volver a dibujar)
+    """
+    movio_oponente = False
+    while True:
+        try:
+            origen, destino = cola.get_nowait()
+        except queue.Empty:
+            break
+        if tablero.realizar_movimiento(origen, destino):
+            movio_oponente = True
+    if movio_oponente:
+        interfaz.reproducir_sonido_movimiento()
+    return movio_oponente
+
+
+def _buscar_servidores_con_espera(timeout_busqueda: float = 3.0):
+    """Busca servidores LAN en un hilo mientras la ventana muestra "Buscando servidores...".
+    
+    Args:
+        timeout_busqueda: Tiempo máximo en segundos para buscar servidores
+    
+    Returns:
+        Diccionario {ip: {"puerto": int, ...}} con los servidores encontrados,
+        o None si se cerró la ventana durante la búsqueda
+    """
+    resultado = queue.Queue(maxsize=1)
+    descubridor = DescubridorServidores(timeout_busqueda=timeout_busqueda)
+    
+    def buscar():
+        try:
+            servidores = descubridor.buscar_servidores()
+        except Exception as e:
+            print(f"Error al buscar servidores: {e}")
+            servidores = {}
+        resultado.put(servidores)
+    
+    threading.Thread(target=buscar, daemon=True).start()
+    
+    pantalla = pygame.display.get_surface() or pygame.display.set_mode((600, 400))
+    fuente = pygame.font.SysFont('Arial', 28)
+    clock = pygame.time.Clock()
+    
+    while True:
+        try:
+            servidores = resultado.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            pygame.event.clear()
+            return servidores
+        
+        if pygame.event.get(eventtype=QUIT):
+            return None
+        
+        # Puntos animados para indicar que la búsqueda sigue en curso
+        puntos = "." * (_get_ticks() // 300 % 4)
+        pantalla.fill((30, 30, 30))
+        texto = fuente.render(f"Buscando servidores{puntos}", True, (255, 255, 255))
+        pantalla.blit(texto, (60, 60))
+        _flip()
+        clock.tick(60)
+
+
 def juego_lan_cliente():
     """Ejecuta una partida LAN conectándose a un servidor (juega con negras)."""
     print("\n=== BUSCAR SERVIDORES EN LA LAN ===")
     
-    # Buscar servidores automáticamente
-    descubridor = DescubridorServidores(timeout_busqueda=3.0)
-    servidores = descubridor.buscar_servidores()
+    # Buscar servidores automáticamente (en segundo plano, la ventana sigue respondiendo)
+    servidores = _buscar_servidores_con_espera(timeout_busqueda=3.0)
+    if servidores is None:
+        return  # Ventana cerrada durante la búsqueda
     
-    # Si no hay servidores, permitir ingreso manual
-    if not servidores:
-        print("\nNo se encontraron servidores automáticamente.")
-        print("Ingresa la IP del servidor manualmente (o 'localhost' para local)")
-        host = input("IP del servidor: ").strip()
-        if not host:
-            host = "localhost"
-    else:
-        # Mostrar servidores encontrados
+    host = None
+    if servidores:
+        # Elegir servidor en un menú de Pygame
         print(f"\nServidores encontrados: {len(servidores)}")
-        ips = list(servidores.keys())
-        
-        for i, ip in enumerate(ips, 1):
-            print(f"{i}. {ip}:{servidores[ip]['puerto']}")
-        
-        # Si hay solo uno, usar ese
-        if len(ips) == 1:
-            host = ips[0]
-            print(f"\nConectando automáticamente a {host}...")
-        else:
-            # Permitir selección
-            try:
-                seleccion = input(f"Selecciona un servidor (1-{len(ips)}): ").strip()
-                indice = int(seleccion) - 1
-                if 0 <= indice < len(ips):
-                    host = ips[indice]
-                else:
-                    print("Opción inválida")
-                    return
-            except (ValueError, IndexError):
-                print("Opción inválida")
-                return
+        opciones = [f"{ip}:{datos['puerto']}" for ip, datos in servidores.items()]
+        seleccion = Menu(opciones + ["IP manual", "Cancelar"], modo="classic").loop()
+        if seleccion is None or seleccion == "Cancelar":
+            return
+        if seleccion != "IP manual":
+            host = seleccion.rsplit(":", 1)[0]
+    else:
+        print("\nNo se encontraron servidores automáticamente.")
+    
+    # Ingreso manual de la IP (vacío = localhost)
+    if host is None:
+        texto = EntradaTexto("IP del servidor (vacío = localhost):").loop()
+        if texto is None:
+            return
+        host = texto.strip() or "localhost"
     
     # Crear el cliente y conectar
     cliente = ClienteAjedrez()
@@ -500,14 +602,15 @@ def juego_lan_cliente():
     
     # Crear interfaz
     interfaz = InterfazUsuario()
+    tablero = interfaz.tablero  # No cambia durante la partida
     
-    # Variable para almacenar movimientos del oponente
-    movimiento_pendiente = {'origen': None, 'destino': None}
+    # Cola de movimientos del oponente: el hilo de red escribe y el bucle de juego lee
+    # Sin límite: llega un movimiento por turno y no debe perderse ninguno
+    cola_movimientos = queue.Queue()
     
     def recibir_movimiento_oponente(origen, destino):
         """Callback cuando se recibe un movimiento del servidor."""
-        movimiento_pendiente['origen'] = origen
-        movimiento_pendiente['destino'] = destino
+        cola_movimientos.put_nowait((origen, destino))
     
     cliente.establecer_callback_movimiento(recibir_movimiento_oponente)
     
@@ -515,50 +618,42 @@ def juego_lan_cliente():
     seleccionado = None
     clock = pygame.time.Clock()
     
+    # Solo se redibuja cuando algo visible cambió (click, movimiento, reloj)
+    dirty = True
+    
     while True:
         dt = clock.tick(60) / 1000.0
-        interfaz.actualizar_tiempos(dt)
+        if interfaz.actualizar_tiempos(dt):
+            dirty = True
         
-        # Verificar si hay movimiento del oponente
-        if movimiento_pendiente['origen'] is not None:
-            origen = movimiento_pendiente['origen']
-            destino = movimiento_pendiente['destino']
-            movimiento_pendiente['origen'] = None
-            movimiento_pendiente['destino'] = None
-            
-            # Aplicar movimiento del oponente (blancas)
-            if interfaz.tablero.realizar_movimiento(origen, destino):
-                interfaz.reproducir_sonido_movimiento()
+        # Aplicar los movimientos del oponente (blancas) recibidos desde el último frame
+        if _aplicar_movimientos_oponente(cola_movimientos, tablero, interfaz):
+            dirty = True
         
         # Manejo de eventos locales
-        continuar, click = interfaz.manejar_eventos()
+        continuar, click, expuesta = interfaz.manejar_eventos()
         if not continuar or not cliente.conectado:
             break
+        if expuesta:
+            dirty = True  # La ventana volvió a verse: repintar aunque no haya cambios
         
         # Solo permitir clicks si es el turno de negras (cliente)
-        if click and interfaz.tablero.turno == Color.NEGRO:
-            if seleccionado is None:
-                if (click in interfaz.tablero.casillas and 
-                    interfaz.tablero.casillas[click] and 
-                    interfaz.tablero.casillas[click].color == Color.NEGRO):
-                    seleccionado = click
-            else:
-                if interfaz.tablero.realizar_movimiento(seleccionado, click):
-                    # Enviar el movimiento al servidor
-                    cliente.enviar_movimiento(seleccionado, click)
-                    interfaz.reproducir_sonido_movimiento()
-                    seleccionado = None
-                else:
-                    if (click in interfaz.tablero.casillas and 
-                        interfaz.tablero.casillas[click] and 
-                        interfaz.tablero.casillas[click].color == Color.NEGRO):
-                        seleccionado = click
-                    else:
-                        seleccionado = None
+        if click and tablero.turno == Color.NEGRO:
+            origen = seleccionado
+            seleccionado, movido = _procesar_click(
+                tablero, seleccionado, click, Color.NEGRO
+            )
+            if movido:
+                # Enviar el movimiento al servidor
+                cliente.enviar_movimiento(origen, click)
+                interfaz.reproducir_sonido_movimiento()
+            dirty = True
         
         # Redibujar
-        interfaz.dibujar_tablero(seleccionado)
-        pygame.display.flip()
+        if dirty:
+            interfaz.dibujar_tablero(seleccionado)
+            _flip()
+            dirty = False
     
     cliente.cerrar()
 
@@ -581,7 +676,10 @@ def juego_sombras():
     pantalla = pygame.display.set_mode((800, 600))
     pygame.display.set_caption("Ajedrez de las Sombras")
     clock = pygame.time.Clock()
-    fuente = pygame.font.SysFont("Arial", 16)
+    fuente = _obtener_fuente()
+    textos_turno = {}  # Superficies de "Turno: ..." por valor de turno
+    
+    from ajedrez_sombras.constantes import BOARD_OFFSET_X, BOARD_OFFSET_Y, TILE_SIZE, GRID_WIDTH, GRID_HEIGHT
     
     turno = "JUGADOR"
     pieza_seleccionada = None
@@ -590,49 +688,53 @@ def juego_sombras():
     while corriendo:
         clock.tick(30)
         
-        # Procesar eventos
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                corriendo = False
+        # Procesar eventos: un solo lote por frame; QUIT primero y solo el último click
+        # Solo se extraen QUIT y clics (filtrado en C); el resto se descarta
+        eventos = pygame.event.get(eventtype=EVENTOS_JUEGO)
+        # get() ya bombeó la cola: sin pump no se pierde nada llegado entre ambas llamadas
+        pygame.event.clear(pump=False)
+        salir = any(e.type == QUIT for e in eventos)
+        clics = [e for e in eventos if e.type == MOUSEBUTTONDOWN]
+        ultimo_click = clics[-1] if clics else None
+        
+        if salir:
+            corriendo = False
+        
+        elif ultimo_click is not None and turno == "JUGADOR":
+            # Click del jugador
+            mouse_x, mouse_y = ultimo_click.pos
             
-            elif evento.type == pygame.MOUSEBUTTONDOWN and turno == "JUGADOR":
-                # Click del jugador
-                mouse_x, mouse_y = pygame.mouse.get_pos()
-                
-                # Calcular posición en grid
-                from ajedrez_sombras.constantes import BOARD_OFFSET_X, BOARD_OFFSET_Y, TILE_SIZE, GRID_WIDTH, GRID_HEIGHT
-                
-                grid_x = (mouse_x - BOARD_OFFSET_X) // TILE_SIZE
-                grid_y = (mouse_y - BOARD_OFFSET_Y) // TILE_SIZE
+            # Calcular posición en grid
+            grid_x = (mouse_x - BOARD_OFFSET_X) // TILE_SIZE
+            grid_y = (mouse_y - BOARD_OFFSET_Y) // TILE_SIZE
+            
+            if 0 <= grid_x < GRID_WIDTH and 0 <= grid_y < GRID_HEIGHT:
+                pieza_en_casilla = tablero.obtener_pieza_en(grid_x, grid_y)
                 
-                if 0 <= grid_x < GRID_WIDTH and 0 <= grid_y < GRID_HEIGHT:
-                    pieza_en_casilla = tablero.obtener_pieza_en(grid_x, grid_y)
-                    
-                    if pieza_seleccionada is None:
-                        # Seleccionar pieza del jugador
-                        if pieza_en_casilla and pieza_en_casilla.team == "JUGADOR":
-                            pieza_seleccionada = pieza_en_casilla
-                            print(f"Seleccionado: {pieza_en_casilla.nombre} en ({grid_x}, {grid_y})")
+                if pieza_seleccionada is None:
+                    # Seleccionar pieza del jugador
+                    if pieza_en_casilla is not None and pieza_en_casilla.team == "JUGADOR":
+                        pieza_seleccionada = pieza_en_casilla
+                        log.debug("Seleccionado: %s en (%d, %d)", pieza_en_casilla.nombre, grid_x, grid_y)
+                else:
+                    # Intentar mover a destino
+                    if pieza_en_casilla == pieza_seleccionada:
+                        # Deseleccionar
+                        pieza_seleccionada = None
                     else:
-                        # Intentar mover a destino
-                        if pieza_en_casilla == pieza_seleccionada:
-                            # Deseleccionar
+                        # Mover si es movimiento válido
+                        if pieza_seleccionada.es_movimiento_valido(tablero, grid_x, grid_y):
+                            tablero.mover_pieza(pieza_seleccionada, grid_x, grid_y)
+                            log.debug("%s se movió a (%d, %d)", pieza_seleccionada.nombre, grid_x, grid_y)
                             pieza_seleccionada = None
+                            turno = "ENEMIGO"
                         else:
-                            # Mover si es movimiento válido
-                            movimientos_validos = pieza_seleccionada.obtener_movimientos_validos(tablero)
-                            if (grid_x, grid_y) in movimientos_validos:
-                                tablero.mover_pieza(pieza_seleccionada, grid_x, grid_y)
-                                print(f"{pieza_seleccionada.nombre} se movió a ({grid_x}, {grid_y})")
-                                pieza_seleccionada = None
-                                turno = "ENEMIGO"
+                            # Seleccionar otra pieza
+                            if pieza_en_casilla is not None and pieza_en_casilla.team == "JUGADOR":
+                                pieza_seleccionada = pieza_en_casilla
+                                log.debug("Seleccionado: %s en (%d, %d)", pieza_en_casilla.nombre, grid_x, grid_y)
                             else:
-                                # Seleccionar otra pieza
-                                if pieza_en_casilla and pieza_en_casilla.team == "JUGADOR":
-                                    pieza_seleccionada = pieza_en_casilla
-                                    print(f"Seleccionado: {pieza_en_casilla.nombre} en ({grid_x}, {grid_y})")
-                                else:
-                                    pieza_seleccionada = None
+                                pieza_seleccionada = None
         
         # Turno de la IA
         if turno == "ENEMIGO":
@@ -644,7 +746,7 @@ def juego_sombras():
             if movimiento:
                 pieza, x, y = movimiento
                 tablero.mover_pieza(pieza, x, y)
-                print(f"IA movió {pieza.nombre} a ({x}, {y})")
+                log.debug("IA movió %s a (%d, %d)", pieza.nombre, x, y)
             
             turno = "JUGADOR"
         
@@ -666,12 +768,14 @@ def juego_sombras():
         for pieza in tablero.piezas:
             pieza.dibujar_barra_hp(pantalla)
         
-        # Dibujar información
-        info_turno = f"Turno: {turno}"
-        info_text = fuente.render(info_turno, True, (255, 255, 255))
+        # Dibujar información (solo hay dos textos posibles: se renderizan una vez)
+        info_text = textos_turno.get(turno)
+        if info_text is None:
+            info_text = fuente.render(f"Turno: {turno}", True, (255, 255, 255))
+            textos_turno[turno] = info_text
         pantalla.blit(info_text, (10, 10))
         
-        pygame.display.flip()
+        _flip()
     
     print("\nFin de la partida.\n")
 
@@ -5,8 +5,12 @@
 """
 from enum import Enum
 import os
+from typing import Optional
 import pygame
 
+# Flag de superficie ligado al módulo (evita pygame.SRCALPHA en cada creación)
+SRCALPHA = pygame.SRCALPHA
+
 class Color(Enum):
     BLANCO = "blanco"
     NEGRO = "negro"
@@ -26,18 +30,45 @@ class EstadoJuego(Enum):
     TIEMPO = "tiempo_agotado"
     EMPATE = "empate"
 
+# Partes del nombre de imagen ("TORRE_BLANCO") por enum, sin ternarios ni .upper()
+_COLOR_SUFFIX = {Color.BLANCO: "BLANCO", Color.NEGRO: "NEGRO"}
+_TIPO_PREFIX = {t: t.value.upper() for t in TipoPieza}
+
 class GestorRecursos:
     def __init__(self):
-        """Inicializa el gestor y carga recursos (imágenes y sonidos) desde el directorio del proyecto."""
-        self.imagenes = {}
+        """Inicializa el gestor de recursos (imágenes y sonidos) del directorio del proyecto.
+        
+        La carga se difiere hasta el primer uso: un menú que solo necesita el sonido
+        no paga la lectura y decodificación de las imágenes de piezas.
+        """
+        self._imagenes = {}
+        self._imagenes_cargadas = False
+        # Atlas con todas las imágenes de piezas y la región de cada una
+        self._atlas: Optional[pygame.Surface] = None
+        self._rects_atlas = {}
+        # Imágenes indexadas por (Color, TipoPieza): la consulta por frame es un solo hash
+        self._imagenes_por_clave = {}
+        # Placeholder único para combinaciones sin imagen (no se crea una superficie por consulta)
+        self._placeholder = pygame.Surface((60, 60), SRCALPHA)
         self.sonidos = {}
+        self._sonidos_cargados = False
         self.directorio_actual = os.path.dirname(os.path.abspath(__file__))
-        self.cargar_imagenes()
-        self.cargar_sonidos()
+        self.directorio_imagenes = os.path.join(self.directorio_actual, "images")
+    
+    @property
+    def imagenes(self) -> dict:
+        """Imágenes por nombre ("TORRE_BLANCO", "BOSS", ...); se cargan en el primer acceso."""
+        self._asegurar_cargado()
+        return self._imagenes
+    
+    def _asegurar_cargado(self):
+        """Carga las imágenes si todavía no se cargaron."""
+        if not self._imagenes_cargadas:
+            self.cargar_imagenes()
         
     def cargar_imagenes(self):
         """Intentar cargar imágenes; si faltan, crear superficies de color como placeholder."""
-        self.directorio_imagenes = os.path.join(self.directorio_actual, "images")
+        self._imagenes_cargadas = True
         if not os.path.exists(self.directorio_imagenes):
             os.makedirs(self.directorio_imagenes)
             print("Se creó el directorio 'images'")
@@ -59,25 +90,77 @@ class GestorRecursos:
             "BOSS": "boss.png"  # Imagen especial del Boss (Rey Caído)
         }
         
-        for nombre, archivo in nombres_imagenes.items():
+        # Atlas: todas las imágenes en una sola superficie, una franja de 60x60 por
+        # imagen. Los blits de piezas leen siempre de la misma superficie origen.
+        atlas = pygame.Surface((60 * len(nombres_imagenes), 60), SRCALPHA)
+        self._rects_atlas = {}
+        
+        for i, (nombre, archivo) in enumerate(nombres_imagenes.items()):
+            rect = pygame.Rect(60 * i, 0, 60, 60)
+            self._rects_atlas[nombre] = rect
             ruta_completa = os.path.join(self.directorio_imagenes, archivo)
             try:
                 imagen = pygame.image.load(ruta_completa).convert_alpha()
-                imagen = pygame.transform.scale(imagen, (60, 60))
-                self.imagenes[nombre] = imagen
+                # Solo reescalar si la imagen no viene ya a 60x60
+                if imagen.get_size() != (60, 60):
+                    imagen = pygame.transform.smoothscale(imagen, (60, 60))
+                # El atlas empieza transparente: MAX copia los píxeles (y su alfa) tal cual
+                atlas.blit(imagen, rect, special_flags=pygame.BLEND_RGBA_MAX)
                 print(f"Imagen cargada: {archivo}")
             except pygame.error:
                 print(f"Advertencia: No se pudo cargar {archivo}")
-                self.imagenes[nombre] = pygame.Surface((60, 60), pygame.SRCALPHA)
                 if "NEGRO" in nombre:
                     color = (139, 69, 19)
                 else:
                     color = (240, 217, 181)
-                pygame.draw.rect(self.imagenes[nombre], color, (0, 0, 60, 60))
+                pygame.draw.rect(atlas, color, rect)
+        
+        # La carga ocurre en el primer uso, ya con la pantalla creada: el atlas se
+        # convierte aquí al formato de la pantalla y los blits usan la ruta rápida de SDL
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        self._atlas = atlas
+        self._recortar_atlas()
+    
+    def _recortar_atlas(self):
+        """Crea cada imagen como subsuperficie del atlas (comparte sus píxeles, sin copia)."""
+        self._imagenes = {
+            nombre: self._atlas.subsurface(rect)
+            for nombre, rect in self._rects_atlas.items()
+        }
+        self._indexar_imagenes()
+    
+    def reconvertir_a_pantalla(self):
+        """Vuelve a convertir las imágenes al formato de píxel de la pantalla actual.
+        
+        Las imágenes ya se convierten al cargarse; solo hace falta llamarlo si
+        pygame.display.set_mode() cambia la pantalla después de la carga.
+        """
+        if pygame.display.get_surface() is None:
+            return
+        self._placeholder = self._placeholder.convert_alpha()
+        # Si aún no se cargaron, se convertirán contra esta pantalla al cargarse
+        if not self._imagenes_cargadas:
+            return
+        # Una sola conversión para todas las piezas: se convierte el atlas y se
+        # vuelven a recortar las subsuperficies
+        self._atlas = self._atlas.convert_alpha()
+        self._recortar_atlas()
+    
+    def _indexar_imagenes(self):
+        """Construye el índice (Color, TipoPieza) -> imagen a partir de self._imagenes."""
+        self._imagenes_por_clave = {}
+        for color, sufijo in _COLOR_SUFFIX.items():
+            for tipo, prefijo in _TIPO_PREFIX.items():
+                imagen = self._imagenes.get(prefijo + "_" + sufijo)
+                if imagen is not None:
+                    self._imagenes_por_clave[(color, tipo)] = imagen
+    
     def cargar_sonidos(self):
         """Carga sonidos del proyecto; si faltan, continúa sin bloquear la ejecución.
         - Se espera 'sounds/ficha.mp3' para reproducir en menú y movimientos.
         """
+        self._sonidos_cargados = True
         try:
             # Inicializar mixer de Pygame (puede fallar si no hay dispositivo de audio disponible)
             if not pygame.mixer.get_init():
@@ -103,10 +186,11 @@ class GestorRecursos:
                 
     def obtener_imagen(self, color: Color, tipo: TipoPieza) -> pygame.Surface:
         """Devuelve la imagen correspondiente a color/tipo; retorna un placeholder si no existe."""
-        nombre_imagen = f"{tipo.value.upper()}_{'BLANCO' if color == Color.BLANCO else 'NEGRO'}"
-        if nombre_imagen not in self.imagenes:
-            print(f"Advertencia: No se encontró la imagen {nombre_imagen}")
-        return self.imagenes.get(nombre_imagen, pygame.Surface((60, 60), pygame.SRCALPHA))
+        self._asegurar_cargado()
+        return self._imagenes_por_clave.get((color, tipo), self._placeholder)
+    
     def obtener_sonido(self, nombre: str):
         """Devuelve el sonido por nombre ('FICHA'); puede ser None si no está disponible."""
+        if not self._sonidos_cargados:
+            self.cargar_sonidos()
         return self.sonidos.get(nombre)
@@ -224,6 +224,10 @@ class MotorAjedrez:
                                 turno: Color, callback: Callable) -> bool:
         """Busca el mejor movimiento de forma asincrónica en un hilo.
         
+        La posición se convierte a FEN aquí, en el hilo que llama: el hilo de
+        búsqueda solo recibe ese texto inmutable, así la interfaz puede seguir
+        modificando el tablero sin carreras.
+        
         Args:
             tablero_casillas: Diccionario de casillas del tablero
             turno: Color del jugador actual
@@ -239,21 +243,33 @@ class MotorAjedrez:
         if self.hilo_busqueda and self.hilo_busqueda.is_alive():
             return False
         
+        try:
+            fen = self._tablero_a_fen(tablero_casillas, turno)
+        except Exception as e:
+            # Se informa igual que un fallo de búsqueda, para que quien llama lo trate
+            resultado = ResultadoMotor(error=f"Error al convertir el tablero a FEN: {e}")
+            self.estado = EstadoMotor.ERROR
+            with self._lock:
+                self.resultado_actual = resultado
+            if callback:
+                callback(resultado)
+            return False
+        
         self.callback_resultado = callback
+        # Marcar como calculando antes de lanzar el hilo: esta_calculando() es
+        # consistente desde el mismo frame en que se pide la búsqueda
+        self.estado = EstadoMotor.CALCULANDO
         self.hilo_busqueda = threading.Thread(
             target=self._busqueda_en_hilo,
-            args=(tablero_casillas, turno, callback),
+            args=(fen, callback),
             daemon=True
         )
         self.hilo_busqueda.start()
         return True
     
-    def _busqueda_en_hilo(self, tablero_casillas: Dict[Tuple[int, int], Optional[Pieza]], 
-                         turno: Color, callback: Callable):
-        """Ejecuta la búsqueda en un hilo separado."""
+    def _busqueda_en_hilo(self, fen: str, callback: Callable):
+        """Ejecuta la búsqueda en un hilo separado a partir de una posición FEN."""
         try:
-            self.estado = EstadoMotor.CALCULANDO
-            fen = self._tablero_a_fen(tablero_casillas, turno)
             board = chess.Board(fen)
             
             limit = chess.engine.Limit(time=self.nivel.a_milisegundos() / 1000.0)
@@ -10,6 +10,9 @@ from typing import List, Tuple
 from modelos import Color, TipoPieza
 
 class Pieza:
+    # Atributos por instancia en slots: acceso por offset y sin __dict__ propio
+    __slots__ = ('color', 'tipo', 'posicion', 'movimientos', 'imagen')
+    
     def __init__(self, color: Color, tipo: TipoPieza):
         """Crea una pieza con su color y tipo; posición e imagen se asignan desde el tablero."""
         self.color = color
@@ -2,6 +2,7 @@
 
 Responsabilidades:
 - Menu: navegación por teclado para seleccionar el modo de juego
+- EntradaTexto: campo de texto en la ventana (p. ej. IP del servidor LAN)
 - InterfazUsuario: render del tablero, manejo de eventos y temporizadores
 """
 import os
@@ -10,6 +11,13 @@ from typing import List, Optional, Tuple, Dict
 from modelos import Color, EstadoJuego, GestorRecursos
 from ajedrez_clasico import Tablero
 
+# Textos fijos del panel de información por valor de enum
+_TEXTO_TURNO = {Color.BLANCO: "Turno: Blancas", Color.NEGRO: "Turno: Negras"}
+_TEXTO_ESTADO = {e: f"Estado: {e.value.capitalize()}" for e in EstadoJuego}
+
+# Únicos eventos que atiende el bucle de partida (WINDOWEXPOSED obliga a redibujar)
+EVENTOS_JUEGO = [pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED]
+
 class Menu:
     def __init__(self, opciones: List[str], modo: str = "default"):
         """Inicializa el menú con una lista de opciones.
@@ -85,6 +93,48 @@ class Menu:
             pygame.display.flip()
             clock.tick(60)
 
+class EntradaTexto:
+    def __init__(self, titulo: str, texto_inicial: str = ""):
+        """Campo de texto dibujado en la ventana de Pygame (sustituye a input() en consola).
+        - Enter confirma; Escape o cerrar la ventana cancela.
+        """
+        pygame.init()
+        self.pantalla = pygame.display.set_mode((600, 400))
+        self.fuente = pygame.font.SysFont('Arial', 28)
+        self.titulo = titulo
+        self.texto = texto_inicial
+    
+    def loop(self) -> Optional[str]:
+        """Bucle de edición: devuelve el texto al pulsar Enter, o None si se cancela."""
+        clock = pygame.time.Clock()
+        pygame.key.start_text_input()
+        try:
+            while True:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        return None
+                    if event.type == pygame.TEXTINPUT:
+                        self.texto += event.text
+                    elif event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_RETURN:
+                            return self.texto
+                        if event.key == pygame.K_ESCAPE:
+                            return None
+                        if event.key == pygame.K_BACKSPACE:
+                            self.texto = self.texto[:-1]
+                self.pantalla.fill((30, 30, 30))
+                titulo = self.fuente.render(self.titulo, True, (180, 180, 180))
+                self.pantalla.blit(titulo, (60, 60))
+                # Cursor parpadeante al final del texto
+                cursor = "|" if (pygame.time.get_ticks() // 500) % 2 == 0 else ""
+                campo = self.fuente.render(self.texto + cursor, True, (255, 255, 255))
+                self.pantalla.blit(campo, (60, 110))
+                pygame.display.flip()
+                clock.tick(60)
+        finally:
+            # Dejar de generar TEXTINPUT (y cerrar el IME) al salir del campo
+            pygame.key.stop_text_input()
+
 class InterfazUsuario:
     def __init__(self):
         """Crea la UI principal y recursos necesarios para dibujar el tablero.
@@ -96,6 +146,7 @@ class InterfazUsuario:
         self.pantalla = pygame.display.set_mode((self.ancho, self.alto))
         pygame.display.set_caption('Ajedrez')
         self.gestor_recursos = GestorRecursos()
+        # Las imágenes se cargan (y convierten al formato de la pantalla) en el primer uso
         self.tablero = Tablero(self.gestor_recursos)
         # Sonido de ficha (puede ser None si no está disponible)
         self.sonido_ficha = self.gestor_recursos.obtener_sonido("FICHA")
@@ -119,36 +170,55 @@ class InterfazUsuario:
         # Mensaje de estado adicional para modos especiales (LAN, espera, etc.)
         self.mensaje_estado: Optional[str] = None
          
-    def manejar_eventos(self) -> Tuple[bool, Optional[Tuple[int, int]]]:
-        """Procesa eventos de Pygame y traduce clics a coordenadas de casilla."""
+    def manejar_eventos(self) -> Tuple[bool, Optional[Tuple[int, int]], bool]:
+        """Procesa eventos de Pygame y traduce clics a coordenadas de casilla.
+        
+        Retorna (continuar, click, expuesta); expuesta es True si la ventana
+        volvió a mostrarse y hay que redibujarla aunque no haya cambiado nada.
+        """
         try:
-            for evento in pygame.event.get():
+            # Solo se extraen QUIT y clicks (filtrado en C); el resto se descarta
+            eventos = pygame.event.get(eventtype=EVENTOS_JUEGO)
+            # get() ya bombeó la cola: sin pump no se pierde nada llegado entre ambas llamadas
+            pygame.event.clear(pump=False)
+            expuesta = False
+            for evento in eventos:
                 if evento.type == pygame.QUIT:
-                    return False, None
-                elif evento.type == pygame.MOUSEBUTTONDOWN:
+                    return False, None, False
+                if evento.type == pygame.WINDOWEXPOSED:
+                    expuesta = True
+            for evento in eventos:
+                if evento.type == pygame.MOUSEBUTTONDOWN:
                     x = evento.pos[0] // self.cuadrado_tamano
                     y = evento.pos[1] // self.cuadrado_tamano
-                    return True, (x, y)
-            return True, None
+                    return True, (x, y), expuesta
+            return True, None, expuesta
         except Exception as e:
             print(f"Error en manejar_eventos: {e}")
-            return True, None
+            return True, None, False
         
-    def actualizar_tiempos(self, dt: float):
-        """Actualiza temporizadores por turno; marca fin si un jugador agota tiempo."""
+    def actualizar_tiempos(self, dt: float) -> bool:
+        """Actualiza temporizadores por turno; marca fin si un jugador agota tiempo.
+        
+        Retorna True si cambió algo visible (segundo mostrado o estado de la partida).
+        """
         try:
             if not self.timers_activos:
-                return
+                return False
             if self.tablero.estado != EstadoJuego.JUGANDO:
-                return
+                return False
             turno_actual = self.tablero.turno
+            segundos_antes = int(round(self.tiempos[turno_actual]))
             self.tiempos[turno_actual] = max(0.0, self.tiempos[turno_actual] - dt)
             if self.tiempos[turno_actual] <= 0.0:
                 self.timers_activos = False
                 self.tablero.estado = EstadoJuego.TIEMPO
                 print(f"Tiempo agotado para {turno_actual.value}")
+                return True
+            return int(round(self.tiempos[turno_actual])) != segundos_antes
         except Exception as e:
             print(f"Error en actualizar_tiempos: {e}")
+            return False
         
     def dibujar_tablero(self, seleccionado=None):
         """Dibuja casillas y piezas; resalta la casilla seleccionada."""
@@ -182,10 +252,10 @@ class InterfazUsuario:
             self.pantalla.blit(texto_superficie, (20, 610))
             return
         
-        turno_texto = f"Turno: {'Blancas' if self.tablero.turno == Color.BLANCO else 'Negras'}"
+        turno_texto = _TEXTO_TURNO[self.tablero.turno]
         texto_superficie = self.fuente.render(turno_texto, True, self.colores['texto'])
         self.pantalla.blit(texto_superficie, (20, 610))
-        estado_texto = f"Estado: {self.tablero.estado.value.capitalize()}"
+        estado_texto = _TEXTO_ESTADO[self.tablero.estado]
         texto_superficie = self.fuente.render(estado_texto, True, self.colores['texto'])
         self.pantalla.blit(texto_superficie, (300, 610))
         def formato_tiempo(segundos: float) -> str: